@@ -1,9 +1,18 @@
 import asyncio
 import aiohttp
-import json
-from typing import Dict, List, Optional, Tuple
+from yarl import URL
+import mmap
+import os
+import re
+import orjson
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
+from collections import Counter
 import logging
+import argparse
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.panel import Panel
@@ -12,8 +21,12 @@ from rich.table import Table
 from rich.prompt import Confirm
 from rich.logging import RichHandler
 from rich.theme import Theme
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import time
+import random
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from urllib.parse import quote
 
 console = Console(theme=Theme({
@@ -23,17 +36,43 @@ console = Console(theme=Theme({
     "success": "green"
 }))
 
+# Os registros são enfileirados no loop de eventos e renderizados por uma
+# thread em segundo plano (QueueListener). O RichHandler escreve pelo mesmo
+# console da barra de progresso, sem corromper a exibição ao vivo.
+# O QueueHandler já converte tracebacks em texto, então não há rich_tracebacks
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+log_listener = QueueListener(_log_queue, RichHandler(console=console))
+
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.WARNING,
     format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)]
+    handlers=[QueueHandler(_log_queue)]
+)
+logger = logging.getLogger("upload_manager")
+
+# Espaços removidos por str.strip(), em UTF-8 (exceto \r e \n, que delimitam linhas)
+_WS = (
+    rb'(?:[\t\x0b\x0c\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]'
+    rb'|\xe2\x81\x9f|\xe3\x80\x80)*'
+)
+# Início/fim de linha com quebras universais (\n, \r\n ou \r), como no modo texto
+_LINE_START = rb'(?:\A|(?<=\n)|(?<=\r)(?!\n))'
+_LINE_END = rb'(?=[\r\n]|\Z)'
+
+# Uma linha do arquivo de upload: "Nome: <pasta>", uma URL, ou um separador
+# (linha vazia ou comentário iniciado por "_")
+UPLOAD_LINE_PATTERN = re.compile(
+    _LINE_START + _WS
+    + rb'(?:(?i:nome):' + _WS + rb'(?P<n>[^\r\n]*?)|(?P<u>https?://[^\r\n]*?)|(?P<s>_[^\r\n]*)?)'
+    + _WS + _LINE_END
 )
-logger = logging.getLogger("rich")
 
 def parse_upload_file(filepath: str) -> List[Dict]:
     """
     Processa o arquivo de upload e retorna uma lista de grupos.
     Cada grupo contém um nome de pasta e suas URLs.
+    Blocos repetidos com o mesmo nome de pasta são agrupados e URLs
+    duplicadas dentro de uma pasta são descartadas.
     
     Formato esperado do arquivo:
     Nome: Nome da Pasta
@@ -44,59 +83,233 @@ def parse_upload_file(filepath: str) -> List[Dict]:
     http://url3.com
     http://url4.com
     """
-    result = []
+    # dict como conjunto ordenado de URLs por pasta
+    groups: Dict[str, Dict[str, None]] = {}
     current_folder = None
-    current_urls = []
+    # URLs da pasta atual; só é criado na primeira URL do bloco, para que a
+    # ordem das pastas siga o primeiro bloco com URLs (como no parser original)
+    current_urls = None
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            for line in file:
-                line = line.strip()
-                
-                # Pula linhas vazias ou comentários
-                if not line or line.startswith('_'):
-                    if current_folder and current_urls:
-                        result.append({
-                            'folder_name': current_folder,
-                            'urls': current_urls.copy()
-                        })
+        with open(filepath, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            
+            # Uma única varredura por regex sobre o arquivo mapeado em memória;
+            # apenas os trechos capturados são decodificados
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in UPLOAD_LINE_PATTERN.finditer(mm):
+                    name, url = match.group('n', 'u')
+                    
+                    # Processa URLs (só adiciona se tiver uma pasta definida)
+                    if url is not None:
+                        if current_folder:
+                            if current_urls is None:
+                                current_urls = groups.setdefault(current_folder, {})
+                            current_urls[url.decode('utf-8')] = None
+                    
+                    # Processa nome da pasta
+                    elif name is not None:
+                        current_folder = name.decode('utf-8')
+                        current_urls = None
+                    
+                    # Linha vazia ou comentário encerra o grupo atual, desde
+                    # que ele já tenha URLs
+                    elif current_urls is not None:
                         current_folder = None
-                        current_urls = []
-                    continue
-                
-                # Processa nome da pasta
-                if line.lower().startswith('nome:'):
-                    if current_folder and current_urls:
-                        result.append({
-                            'folder_name': current_folder,
-                            'urls': current_urls.copy()
-                        })
-                        current_urls = []
-                    current_folder = line.split(':', 1)[1].strip()
-                
-                # Processa URLs
-                elif line.startswith(('http://', 'https://')):
-                    if current_folder:  # Só adiciona URLs se tiver uma pasta definida
-                        current_urls.append(line)
-        
-        # Adiciona o último grupo se existir
-        if current_folder and current_urls:
-            result.append({
-                'folder_name': current_folder,
-                'urls': current_urls
-            })
+                        current_urls = None
     
     except Exception as e:
         console.print(f"[red]Erro ao ler arquivo: {str(e)}")
         return []
     
-    return result
+    return [
+        {'folder_name': folder, 'urls': list(urls)}
+        for folder, urls in groups.items()
+    ]
+
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+BACKOFF_JITTER = 0.5
+
+def _retry_after_seconds(response: Optional[aiohttp.ClientResponse]) -> float:
+    """Lê o cabeçalho Retry-After (segundos ou data HTTP), se existir."""
+    if response is None:
+        return 0.0
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+async def _sleep_backoff(attempt: int, resp: Optional[aiohttp.ClientResponse] = None) -> None:
+    """
+    Espera antes de uma nova tentativa: backoff exponencial limitado com jitter,
+    respeitando o Retry-After do servidor quando for maior. O Retry-After também
+    é limitado a BACKOFF_CAP, para não prender um worker por tempo indefinido.
+    """
+    delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * BACKOFF_JITTER)
+    delay = max(delay, min(BACKOFF_CAP, _retry_after_seconds(resp)))
+    logger.debug("Aguardando %.2fs antes da próxima tentativa", delay)
+    await asyncio.sleep(delay)
+
+async def _read_json(response: aiohttp.ClientResponse, label: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Decodifica o corpo da resposta direto dos bytes com orjson, sem criar
+    uma str intermediária. O texto bruto só é gerado com o log de depuração ativo.
+    Retorna (dados, None) ou (None, motivo do erro).
+    """
+    body = await response.read()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Resposta da API (%s): %s", label, body.decode('utf-8', 'replace'))
+    if not body.strip():
+        return None, "Resposta vazia"
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        return None, str(e)
+    if not isinstance(data, dict):
+        return None, "Resposta JSON inesperada"
+    return data, None
+
+def _is_unrecoverable(status: int) -> bool:
+    """Erros 4xx (exceto 429) não se resolvem com novas tentativas."""
+    return 400 <= status < 500 and status != 429
+
+# Máximo de requisições simultâneas: teto do limitador, do pool de workers
+# e do pool de conexões (a API é um único host)
+MAX_CONCURRENCY = 32
+
+class AdaptiveLimiter:
+    """
+    Limitador de concorrência adaptativo (estilo AIMD, como o controle de
+    congestionamento do TCP).
+
+    - Início lento: o limite cresce a cada resposta 2xx (dobra por janela)
+      até o primeiro sinal de sobrecarga ou de latência inflada.
+    - Depois, cresce +1 a cada janela de `current_limit` respostas 2xx,
+      enquanto a latência (EMA) não passar de `1 + tolerance` vezes a base.
+    - Sobrecarga (429, 5xx, timeout ou erro de conexão) reduz o limite pela
+      metade; novos sinais são ignorados até passarem as janelas necessárias
+      para recuperar o limite anterior.
+
+    A latência base acompanha a EMA: cai imediatamente e sobe devagar, para
+    não ficar presa a uma única resposta rápida.
+    """
+    def __init__(self, initial_limit: int = 8, min_limit: int = 1, max_limit: int = MAX_CONCURRENCY,
+                 smoothing: float = 0.2, baseline_smoothing: float = 0.02, tolerance: float = 0.5):
+        self.current_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.baseline_smoothing = baseline_smoothing
+        self.tolerance = tolerance
+        self.semaphore = asyncio.Semaphore(initial_limit)
+        self.latency_ema: Optional[float] = None
+        self.baseline_rtt: Optional[float] = None
+        self._slow_start = True
+        # Respostas 2xx na janela atual e janelas restantes sem nova redução
+        self._window_successes = 0
+        self._cooldown_windows = 0
+        # Permissões a serem retidas (não devolvidas) após uma redução do limite
+        self._debt = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        """O chamador informa o status HTTP da resposta em `slot.status`."""
+        await self.semaphore.acquire()
+        slot = SimpleNamespace(status=None)
+        start = time.monotonic()
+        overloaded = False
+        try:
+            yield slot
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            overloaded = True
+            raise
+        finally:
+            latency = time.monotonic() - start
+            self._give_back()
+            status = slot.status
+            if overloaded or (status is not None and (status == 429 or status >= 500)):
+                self._decrease()
+            elif status is not None and 200 <= status < 300:
+                self._record(latency)
+
+    def _give_back(self):
+        if self._debt:
+            self._debt -= 1
+        else:
+            self.semaphore.release()
+
+    def _grow(self):
+        if self.current_limit < self.max_limit:
+            self.current_limit += 1
+            self._give_back()
+
+    def _latency_inflated(self) -> bool:
+        return self.latency_ema > self.baseline_rtt * (1 + self.tolerance)
+
+    def _record(self, latency: float):
+        if self.latency_ema is None:
+            self.latency_ema = self.baseline_rtt = latency
+        else:
+            self.latency_ema += self.smoothing * (latency - self.latency_ema)
+            if self.latency_ema < self.baseline_rtt:
+                self.baseline_rtt = self.latency_ema
+            else:
+                self.baseline_rtt += self.baseline_smoothing * (self.latency_ema - self.baseline_rtt)
+
+        if self._slow_start:
+            if self._latency_inflated():
+                self._slow_start = False
+            else:
+                self._grow()
+            return
+
+        self._window_successes += 1
+        if self._window_successes < self.current_limit:
+            return
+        self._window_successes = 0
+        if self._cooldown_windows:
+            self._cooldown_windows -= 1
+        if not self._latency_inflated():
+            self._grow()
+
+    def _decrease(self):
+        # Sinais de sobrecarga da mesma rajada contam como um só
+        if self._cooldown_windows:
+            return
+
+        self._slow_start = False
+        new_limit = max(self.min_limit, self.current_limit // 2)
+        self._debt += self.current_limit - new_limit
+        self._cooldown_windows = max(1, self.current_limit - new_limit)
+        self._window_successes = 0
+        self.current_limit = new_limit
+        logger.warning(f"Servidor sobrecarregado, concorrência reduzida para {new_limit}")
+
+LIMIT_REACHED_MESSAGE = "Limite de uploads atingido"
 
 class UploadManager:
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # Parâmetro de autenticação comum a todas as requisições
+        self._auth = (("key", api_key),)
         self.base_url = "https://earnvidsapi.com/api"
-        self.stats = {
+        # Endpoints analisados uma única vez
+        self._url_folder_create = URL(f"{self.base_url}/folder/create")
+        self._url_upload = URL(f"{self.base_url}/upload/url")
+        self._url_account_info = URL(f"{self.base_url}/account/info")
+        self.stats = Counter({
             "total_uploads": 0,
             "successful_uploads": 0,
             "failed_uploads": 0,
@@ -104,159 +317,309 @@ class UploadManager:
             "skipped_uploads": 0,
             "start_time": 0,
             "end_time": 0
-        }
+        })
         self.MAX_UPLOADS = 480
-        self.current_uploads = 0
-        self.semaphore = asyncio.Semaphore(5)
-        self.upload_results = []
+        # Orçamento global de uploads: uma vaga é reservada por upload em
+        # andamento, mantida quando ele é confirmado e devolvida quando falha.
+        # Sem vagas livres, novos uploads esperam o resultado dos em andamento
+        self._reserved_uploads = 0
+        self._confirmed_uploads = 0
+        self._budget_changed = asyncio.Condition()
+        self.limiter = AdaptiveLimiter()
+        # Resultados por URL, consumidos pelo gravador em segundo plano (save_results)
+        self.results_queue: asyncio.Queue = asyncio.Queue()
+        # Avanços da barra de progresso ainda não desenhados (ver flush_progress)
+        self.pending_advance = 0
+        # Pastas já criadas (ou em criação) nesta execução, por (parent_id, nome)
+        self._folder_cache: Dict[Tuple[int, str], "asyncio.Future[Optional[int]]"] = {}
+        
+    def show_welcome(self):
+        console.print(Panel(
+            Text("✨ Upload Manager ✨", style="bold cyan", justify="center"),
+            subtitle=f"Máximo de {self.MAX_UPLOADS} uploads",
+            border_style="cyan"
+        ))
+
+    async def verify_api_key(self, session: aiohttp.ClientSession) -> bool:
+        """
+        Valida a chave da API com uma requisição leve a /account/info.
+        A conexão aberta fica no pool e é reaproveitada pelos uploads.
+        """
+        try:
+            async with session.get(self._url_account_info, params=self._auth) as response:
+                status = response.status
+                data, decode_error = await _read_json(response, "conta")
+        except Exception as e:
+            console.print(f"[bold red]❌ Erro ao verificar a chave da API: {str(e)}")
+            return False
+        
+        if status != 200 or decode_error is not None or "result" not in data:
+            console.print(f"[bold red]❌ Chave da API inválida (HTTP {status})")
+            return False
         
+        console.print("[green]✓ Chave da API verificada")
+        return True
+
     async def create_folder(self, session: aiohttp.ClientSession, folder_name: str, parent_id: int = 0) -> Optional[int]:
+        """
+        Cria a pasta uma única vez por execução. Chamadas concorrentes para a
+        mesma pasta compartilham a mesma requisição; falhas não ficam em cache.
+        """
+        key = (parent_id, folder_name)
+        cached = self._folder_cache.get(key)
+        if cached is not None:
+            return await asyncio.shield(cached)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._folder_cache[key] = future
+        try:
+            folder_id = await self._create_folder(session, folder_name, parent_id)
+        except BaseException:
+            self._folder_cache.pop(key, None)
+            future.cancel()
+            raise
+        
+        if folder_id is None:
+            self._folder_cache.pop(key, None)
+        future.set_result(folder_id)
+        return folder_id
+
+    async def _create_folder(self, session: aiohttp.ClientSession, folder_name: str, parent_id: int = 0) -> Optional[int]:
         retries = 3
         for attempt in range(retries):
             try:
                 # Não codifica o nome da pasta, apenas caracteres especiais se necessário
-                url = f"{self.base_url}/folder/create"
-                params = {
-                    "key": self.api_key,
-                    "name": folder_name,  # Remove a codificação quote()
-                    "parent_id": parent_id
-                }
+                url = self._url_folder_create
+                params = self._auth + (("name", folder_name), ("parent_id", parent_id))
                 
-                logger.info(f"Criando pasta: '{folder_name}'")
-                logger.info(f"URL da requisição: {url}")
-                logger.info(f"Parâmetros: {params}")
+                logger.debug("Criando pasta: '%s'", folder_name)
+                logger.debug("URL da requisição: %s", url)
+                logger.debug("Parâmetros: %s", params)
                 
-                async with session.get(url, params=params) as response:
-                    response_text = await response.text()
-                    logger.info(f"Resposta da API (criar pasta): {response_text}")
-                    
-                    if response.status == 503:
-                        logger.warning(f"Servidor indisponível (tentativa {attempt + 1}/{retries})")
-                        if attempt < retries - 1:
-                            await asyncio.sleep(2 * (attempt + 1))
-                            continue
-                        logger.error(f"Servidor indisponível após {retries} tentativas para '{folder_name}'")
-                        return None
-                    
-                    try:
-                        data = json.loads(response_text)
-                        if "result" in data and "fld_id" in data["result"]:
-                            folder_id = data["result"]["fld_id"]
-                            self.stats["total_folders"] += 1
-                            logger.info(f"Pasta criada com sucesso: {folder_name} (ID: {folder_id})")
-                            return folder_id
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Erro ao decodificar resposta JSON: {e}")
-                        logger.error(f"Resposta raw: {response_text}")
+                # A vaga do limitador é liberada assim que a resposta é lida,
+                # antes de qualquer espera entre tentativas
+                async with self.limiter.acquire() as slot, session.get(url, params=params) as response:
+                    status = response.status
+                    data, decode_error = await _read_json(response, "criar pasta")
+                    slot.status = status
+                
+                if status in (429, 503):
+                    logger.warning(f"Servidor indisponível (tentativa {attempt + 1}/{retries})")
+                    if attempt < retries - 1:
+                        await _sleep_backoff(attempt, response)
                         continue
-                    
-                    logger.error(f"Erro ao criar pasta. Resposta: {data}")
+                    logger.error(f"Servidor indisponível após {retries} tentativas para '{folder_name}'")
+                    return None
+                
+                if _is_unrecoverable(status):
+                    logger.error(f"Erro {status} ao criar pasta '{folder_name}': {data}")
                     return None
+                
+                if decode_error is not None:
+                    logger.error(f"Erro ao decodificar resposta JSON: {decode_error}")
+                    if attempt < retries - 1:
+                        await _sleep_backoff(attempt)
+                    continue
+                
+                if "result" in data and "fld_id" in data["result"]:
+                    folder_id = data["result"]["fld_id"]
+                    self.stats["total_folders"] += 1
+                    logger.debug("Pasta criada com sucesso: %s (ID: %s)", folder_name, folder_id)
+                    return folder_id
+                
+                logger.error(f"Erro ao criar pasta. Resposta: {data}")
+                return None
                     
             except Exception as e:
                 logger.error(f"Exceção ao criar pasta '{folder_name}': {str(e)}")
                 if attempt < retries - 1:
+                    await _sleep_backoff(attempt)
                     continue
                 return None
         return None
 
+    @property
+    def limit_reached(self) -> bool:
+        return self._confirmed_uploads >= self.MAX_UPLOADS
+
     async def upload_file(self, session: aiohttp.ClientSession, file_url: str, folder_id: int) -> Tuple[bool, str]:
-        if self.current_uploads >= self.MAX_UPLOADS:
-            logger.warning(f"Limite de uploads atingido ({self.MAX_UPLOADS})")
-            self.stats["skipped_uploads"] += 1
-            return False, "Limite de uploads atingido"
-
-        async with self.semaphore:
-            retries = 3
-            for attempt in range(retries):
-                try:
-                    logger.info(f"Iniciando upload: {file_url}")
-                    
-                    # Verifica se arquivo existe
-                    if not await self.verify_upload(session, file_url):
-                        logger.error(f"Arquivo não encontrado: {file_url}")
-                        return False, "Arquivo não encontrado"
-
-                    url = f"{self.base_url}/upload/url"
-                    params = {
-                        "key": self.api_key,
-                        "url": file_url,  # Remove a codificação quote()
-                        "fld_id": folder_id
-                    }
-                    
-                    logger.info(f"URL da requisição: {url}")
-                    logger.info(f"Parâmetros: {params}")
-                    
-                    async with session.get(url, params=params) as response:
-                        response_text = await response.text()
-                        logger.info(f"Resposta da API (upload): {response_text}")
-                        
-                        if response.status == 503:
-                            logger.warning(f"Servidor indisponível (tentativa {attempt + 1}/{retries})")
-                            if attempt < retries - 1:
-                                await asyncio.sleep(2 * (attempt + 1))
-                                continue
-                            return False, "Servidor temporariamente indisponível"
-                        
-                        try:
-                            data = json.loads(response_text)
-                            if "result" in data:
-                                self.current_uploads += 1
-                                self.stats["successful_uploads"] += 1
-                                logger.info(f"Upload realizado com sucesso: {file_url}")
-                                return True, "Upload realizado com sucesso"
-                            else:
-                                logger.error(f"Erro na resposta da API: {data}")
-                                return False, f"Erro: {data.get('message', 'Desconhecido')}"
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Erro ao decodificar resposta JSON: {e}")
-                            logger.error(f"Resposta raw: {response_text}")
-                            if attempt < retries - 1:
-                                continue
-                            return False, "Resposta inválida do servidor"
-                        
-                except Exception as e:
-                    logger.error(f"Exceção durante upload: {str(e)}")
+        async with self._budget_changed:
+            await self._budget_changed.wait_for(
+                lambda: self.limit_reached or self._reserved_uploads < self.MAX_UPLOADS
+            )
+            if self.limit_reached:
+                logger.debug("Limite de uploads atingido, ignorando: %s", file_url)
+                return False, LIMIT_REACHED_MESSAGE
+            self._reserved_uploads += 1
+        
+        success = False
+        try:
+            success, message = await self._upload_file(session, file_url, folder_id)
+        finally:
+            async with self._budget_changed:
+                if success:
+                    self._confirmed_uploads += 1
+                else:
+                    self._reserved_uploads -= 1
+                self._budget_changed.notify_all()
+        return success, message
+
+    async def _upload_file(self, session: aiohttp.ClientSession, file_url: str, folder_id: int) -> Tuple[bool, str]:
+        retries = 3
+        for attempt in range(retries):
+            try:
+                logger.debug("Iniciando upload: %s", file_url)
+                
+                url = self._url_upload
+                params = self._auth + (("url", file_url), ("fld_id", folder_id))
+                
+                logger.debug("URL da requisição: %s", url)
+                logger.debug("Parâmetros: %s", params)
+                
+                async with self.limiter.acquire() as slot, session.get(url, params=params) as response:
+                    status = response.status
+                    data, decode_error = await _read_json(response, "upload")
+                    slot.status = status
+                
+                if status in (429, 503):
+                    logger.warning(f"Servidor indisponível (tentativa {attempt + 1}/{retries})")
                     if attempt < retries - 1:
+                        await _sleep_backoff(attempt, response)
                         continue
-                    return False, f"Erro: {str(e)}"
-            
-            self.stats["failed_uploads"] += 1
-            return False, "Todas as tentativas falharam"
+                    return False, "Servidor temporariamente indisponível"
+                
+                if _is_unrecoverable(status):
+                    logger.error(f"Erro {status} no upload de {file_url}: {data}")
+                    return False, f"Erro HTTP {status}"
+                
+                if decode_error is not None:
+                    logger.error(f"Erro ao decodificar resposta JSON: {decode_error}")
+                    if attempt < retries - 1:
+                        await _sleep_backoff(attempt)
+                        continue
+                    return False, "Resposta inválida do servidor"
+                
+                if "result" in data:
+                    logger.debug("Upload realizado com sucesso: %s", file_url)
+                    return True, "Upload realizado com sucesso"
+                else:
+                    logger.error(f"Erro na resposta da API: {data}")
+                    return False, f"Erro: {data.get('message', 'Desconhecido')}"
+                    
+            except Exception as e:
+                logger.error(f"Exceção durante upload: {str(e)}")
+                if attempt < retries - 1:
+                    await _sleep_backoff(attempt)
+                    continue
+                return False, f"Erro: {str(e)}"
+        
+        return False, "Todas as tentativas falharam"
 
-async def process_group(manager: UploadManager, session: aiohttp.ClientSession, group: Dict, progress) -> None:
-    folder_name = group['folder_name']
-    urls = group['urls']
-    
-    folder_id = await manager.create_folder(session, folder_name)
-    if not folder_id:
-        return
+UPLOAD_QUEUE_SIZE = 64
 
-    upload_tasks = []
-    for url in urls:
-        if manager.current_uploads >= manager.MAX_UPLOADS:
-            console.print(f"[yellow]⚠️ Limite de {manager.MAX_UPLOADS} uploads atingido. Restante será ignorado.")
-            break
-            
-        task = asyncio.create_task(manager.upload_file(session, url, folder_id))
-        upload_tasks.append((url, task))
+FOLDER_WORKERS = 8
+
+async def _resolve_folders(manager: UploadManager, session: aiohttp.ClientSession, groups: Iterator[Dict],
+                           upload_queue: asyncio.Queue) -> None:
+    # O iterador é compartilhado entre os resolvedores: cada grupo é tratado por um só
+    for group in groups:
+        # Para antes de criar novas pastas assim que o limite é atingido
+        if manager.limit_reached:
+            return
+        folder_name = group['folder_name']
+        folder_id = await manager.create_folder(session, folder_name)
+        if not folder_id:
+            continue
         
-    for url, task in upload_tasks:
-        success, message = await task
-        status = "[green]✓" if success else "[red]✗"
-        console.print(f"{status} {url}: {message}")
-        progress.update(progress.task_ids[0], advance=1)
+        for url in group['urls']:
+            if manager.limit_reached:
+                return
+            await upload_queue.put((folder_name, folder_id, url))
+
+async def _enqueue_uploads(manager: UploadManager, session: aiohttp.ClientSession, upload_groups: List[Dict],
+                           upload_queue: asyncio.Queue) -> None:
+    """Cria as pastas em paralelo (até FOLDER_WORKERS por vez) e enfileira as URLs de cada uma."""
+    groups = iter(upload_groups)
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(FOLDER_WORKERS, len(upload_groups))):
+            tg.create_task(_resolve_folders(manager, session, groups, upload_queue))
+    
+    if manager.limit_reached:
+        console.print(f"[yellow]⚠️ Limite de {manager.MAX_UPLOADS} uploads atingido. Restante será ignorado.")
+
+async def produce_uploads(manager: UploadManager, session: aiohttp.ClientSession, upload_groups: List[Dict],
+                          upload_queue: asyncio.Queue, num_workers: int) -> None:
+    """Cria as pastas e enfileira os pares (pasta, URL) para os workers."""
+    await _enqueue_uploads(manager, session, upload_groups, upload_queue)
+    
+    # Um sentinela por worker para encerrar o pool. Só no término normal:
+    # em caso de erro/cancelamento o TaskGroup já cancela os workers, e a
+    # fila cheia sem consumidores travaria o produtor aqui
+    for _ in range(num_workers):
+        await upload_queue.put(None)
+
+async def _run_and_record(manager: UploadManager, session: aiohttp.ClientSession,
+                          folder_name: str, folder_id: int, url: str) -> None:
+    """Executa um upload e registra estatísticas, resultado e progresso."""
+    success, message = await manager.upload_file(session, url, folder_id)
+    
+    manager.stats["total_uploads"] += 1
+    if success:
+        manager.stats["successful_uploads"] += 1
+    elif message == LIMIT_REACHED_MESSAGE:
+        manager.stats["skipped_uploads"] += 1
+    else:
+        manager.stats["failed_uploads"] += 1
+        console.print(f"[red]✗ {url}: {message}")
+    manager.pending_advance += 1
+    
+    manager.results_queue.put_nowait({
+        "url": url,
+        "success": success,
+        "message": message,
+        "folder": folder_name
+    })
+
+async def upload_worker(manager: UploadManager, session: aiohttp.ClientSession,
+                        upload_queue: asyncio.Queue) -> None:
+    while True:
+        item = await upload_queue.get()
+        if item is None:
+            return
         
-        manager.upload_results.append({
-            "url": url,
-            "success": success,
-            "message": message,
-            "folder": folder_name
-        })
+        folder_name, folder_id, url = item
+        await _run_and_record(manager, session, folder_name, folder_id, url)
+
+async def flush_progress(manager: UploadManager, progress, task_id, interval: float = 0.1) -> None:
+    """Aplica os avanços acumulados na barra em lotes, no máximo a cada `interval` segundos."""
+    while True:
+        await asyncio.sleep(interval)
+        if manager.pending_advance:
+            progress.update(task_id, advance=manager.pending_advance)
+            manager.pending_advance = 0
+
+RESULTS_FILE = "upload_results.jsonl"
 
-def save_results(results: List[Dict], filename: str = "upload_results.json"):
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+def _write_records(file, records: List[Dict]) -> None:
+    file.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
+    file.flush()
+
+async def save_results(results_queue: asyncio.Queue, filename: str = RESULTS_FILE) -> None:
+    """
+    Grava os resultados em JSON Lines à medida que os uploads terminam,
+    até receber o sentinela None. A escrita em disco roda fora do loop de eventos.
+    """
+    with open(filename, 'wb') as f:
+        done = False
+        while not done:
+            records = [await results_queue.get()]
+            while not results_queue.empty():
+                records.append(results_queue.get_nowait())
+            if None in records:
+                done = True
+                records = [record for record in records if record is not None]
+            if records:
+                await asyncio.to_thread(_write_records, f, records)
 
 def show_summary(stats: Dict):
     duration = stats["end_time"] - stats["start_time"]
@@ -282,9 +645,6 @@ async def main():
     uploader = UploadManager(API_KEY)
     uploader.show_welcome()
     
-    if not uploader.verify_api_key():
-        return
-    
     if not Path(UPLOAD_FILE).exists():
         console.print(f"[bold red]❌ Arquivo {UPLOAD_FILE} não encontrado!")
         return
@@ -301,10 +661,23 @@ async def main():
     if not Confirm.ask("\n💫 Iniciar uploads?"):
         return
     
-    timeout = aiohttp.ClientTimeout(total=None, connect=60, sock_connect=60, sock_read=60)
-    connector = aiohttp.TCPConnector(limit=None, ttl_dns_cache=300)
+    # Limite total por requisição: um upload travado não prende um worker indefinidamente
+    timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+    # Conexões keep-alive reutilizadas para o único host da API, com DNS em cache
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENCY,
+        limit_per_host=MAX_CONCURRENCY,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=75,
+        force_close=False
+    )
     
     async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Também aquece o pool: DNS e TLS já resolvidos antes da primeira pasta
+        if not await uploader.verify_api_key(session):
+            return
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -316,30 +689,57 @@ async def main():
             
             uploader.stats["start_time"] = time.time()
             
-            tasks = []
-            for group in upload_groups:
-                task = asyncio.create_task(process_group(uploader, session, group, progress))
-                tasks.append(task)
+            # Pool fixo de workers; a concorrência efetiva é governada pelo limitador
+            num_workers = uploader.limiter.max_limit
+            upload_queue: asyncio.Queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+            flusher = asyncio.create_task(flush_progress(uploader, progress, total_progress))
+            writer = asyncio.create_task(save_results(uploader.results_queue))
             
-            await asyncio.gather(*tasks)
+            # TaskGroup: uma falha (ou Ctrl-C) cancela produtor e workers juntos
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(produce_uploads(uploader, session, upload_groups, upload_queue, num_workers))
+                    for _ in range(num_workers):
+                        tg.create_task(upload_worker(uploader, session, upload_queue))
+            finally:
+                flusher.cancel()
+                uploader.results_queue.put_nowait(None)
+                await writer
+                progress.update(total_progress, advance=uploader.pending_advance)
+                uploader.pending_advance = 0
             
             uploader.stats["end_time"] = time.time()
     
     show_summary(uploader.stats)
     
-    # Salva os resultados em um arquivo JSON
-    save_results(uploader.upload_results)
-    console.print("\n[green]✓ Resultados salvos em 'upload_results.json'")
+    console.print(f"\n[green]✓ Resultados salvos em '{RESULTS_FILE}'")
     
     console.print("\n[bold green]✨ Upload Manager finalizado com sucesso! ✨")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upload Manager")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Exibe logs de depuração por requisição")
+    args = parser.parse_args()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    # uvloop (libuv) quando disponível; no Windows usa o loop baseado em select.
+    # O loop é escolhido via loop_factory, sem alterar a política global
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = asyncio.SelectorEventLoop if sys.platform == "win32" else None
+    
+    log_listener.start()
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️ Interrompido pelo usuário")
     except Exception as e:
         console.print(f"\n[red]❌ Erro: {str(e)}")
     finally:
+        log_listener.stop()
         console.print("\n[dim]Pressione Enter para sair...")
         input()
@@ -0,0 +1,74 @@
+from typing import Dict, List
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("rich")
+
+from test import parse_upload_file
+
+
+def legacy_parse_upload_file(filepath: str) -> List[Dict]:
+    """Parser linha a linha original, usado como referência."""
+    result = []
+    current_folder = None
+    current_urls = []
+
+    with open(filepath, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+
+            if not line or line.startswith('_'):
+                if current_folder and current_urls:
+                    result.append({'folder_name': current_folder, 'urls': current_urls.copy()})
+                    current_folder = None
+                    current_urls = []
+                continue
+
+            if line.lower().startswith('nome:'):
+                if current_folder and current_urls:
+                    result.append({'folder_name': current_folder, 'urls': current_urls.copy()})
+                    current_urls = []
+                current_folder = line.split(':', 1)[1].strip()
+
+            elif line.startswith(('http://', 'https://')):
+                if current_folder:
+                    current_urls.append(line)
+
+    if current_folder and current_urls:
+        result.append({'folder_name': current_folder, 'urls': current_urls})
+
+    return result
+
+
+SAMPLES = {
+    "basico": "Nome: A\nhttp://a/1\nhttps://a/2\n\nNome: B\nhttp://b/1\n",
+    "linha_vazia_apos_nome": "Nome: A\n\nhttp://x\n",
+    "comentario_apos_nome": "Nome: A\n_comentario\nhttp://x\n",
+    "url_orfa_apos_grupo": "Nome: A\nhttp://a/1\n\nhttp://orfa\nNome: B\nhttp://b/1",
+    "sem_pasta": "http://orfa\nNome:\nhttp://x\n",
+    "crlf": "Nome: A\r\nhttp://a/1\r\n\r\nNome: B\r\nhttp://b/1\r\n",
+    "cr": "Nome: A\rhttp://a/1\r\rNome: B\rhttp://b/1\r",
+    "espacos_unicode": "\fNOME: Pasta A \nhttp://a/1\f\n 　\nnome:B\nhttp://b/1 \n",
+    "linhas_ignoradas": "Nome: A\nqualquer coisa\nhttp://a/1\nftp://ignorada\n",
+    "bloco_vazio_antes": "Nome: A\nNome: B\nhttp://b/1\n\nNome: A\nhttp://a/1\n",
+}
+
+
+@pytest.mark.parametrize("content", SAMPLES.values(), ids=SAMPLES.keys())
+def test_matches_legacy_parser(tmp_path, content):
+    path = tmp_path / "upload_list.txt"
+    path.write_bytes(content.encode('utf-8'))
+    assert parse_upload_file(str(path)) == legacy_parse_upload_file(str(path))
+
+
+def test_merges_repeated_folders_and_urls(tmp_path):
+    path = tmp_path / "upload_list.txt"
+    path.write_text("Nome: A\nhttp://x/1\nhttp://x/1\n\nNome: A\nhttp://x/2\n", encoding='utf-8')
+    assert parse_upload_file(str(path)) == [{'folder_name': 'A', 'urls': ['http://x/1', 'http://x/2']}]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "upload_list.txt"
+    path.write_bytes(b"")
+    assert parse_upload_file(str(path)) == []